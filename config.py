@@ -4,34 +4,49 @@ Customize these settings for your specific event source.
 Environment variables override these defaults (see .env.example).
 """
 import os
-from typing import Dict, List, Any
+from typing import Any, Callable, Dict, List
+
+# All environment overrides below read os.environ through _get().
+_ENV = os.environ
+
+
+def _get(name: str, default: Any, cast: Callable[[str], Any] = str) -> Any:
+    """Return environment variable ``name`` cast with ``cast``, or ``default`` if unset."""
+    value = _ENV.get(name)
+    return cast(value) if value is not None else default
+
+
+def _bool(value: str) -> bool:
+    """Interpret common truthy strings ("1", "true", "yes") from the environment."""
+    return value.lower() in ("1", "true", "yes")
+
 
 # ============================================================================
 # SITE CONFIGURATION
 # ============================================================================
 # URL to scrape events from
-EVENTS_URL = os.getenv("EVENTS_URL", "https://example.com/events")
+EVENTS_URL = _get("EVENTS_URL", "https://example.com/events")
 
 # Base URL for building absolute URLs (e.g., for event detail pages)
-BASE_URL = os.getenv("BASE_URL", "https://example.com")
+BASE_URL = _get("BASE_URL", "https://example.com")
 
 # ============================================================================
 # OUTPUT CONFIGURATION
 # ============================================================================
 # Directory where generated files will be written
-OUTPUT_DIR = os.getenv("OUTPUT_DIR", "docs")
+OUTPUT_DIR = _get("OUTPUT_DIR", "docs")
 
 # Filename for the generated iCalendar file (without .ics extension)
-ICS_FILENAME = os.getenv("ICS_FILENAME", "calendar")
+ICS_FILENAME = _get("ICS_FILENAME", "calendar")
 
 # Log file name
-LOG_FILE = os.getenv("LOG_FILE", "scraper_log.txt")
+LOG_FILE = _get("LOG_FILE", "scraper_log.txt")
 
 # ============================================================================
 # HTTP REQUEST SETTINGS
 # ============================================================================
-HTTP_TIMEOUT = int(os.getenv("HTTP_TIMEOUT", "60"))
-HTTP_RETRIES = int(os.getenv("HTTP_RETRIES", "3"))
+HTTP_TIMEOUT = _get("HTTP_TIMEOUT", 60, int)
+HTTP_RETRIES = _get("HTTP_RETRIES", 3, int)
 HTTP_RETRY_DELAY = 1
 HTTP_RETRY_MULTIPLIER = 2
 USER_AGENT = (
@@ -41,16 +56,20 @@ USER_AGENT = (
 )
 
 # Delay between requests (seconds) - be respectful to the server
-FETCH_DELAY_SEC = float(os.getenv("FETCH_DELAY_SEC", "0.5"))
+FETCH_DELAY_SEC = _get("FETCH_DELAY_SEC", 0.5, float)
+
+# Number of detail pages fetched concurrently (requests still start at most
+# once per FETCH_DELAY_SEC across all workers)
+FETCH_WORKERS = _get("FETCH_WORKERS", 4, int)
 
 # ============================================================================
 # CACHE CONFIGURATION
 # ============================================================================
 # Cache file for event details (to avoid re-scraping unchanged data)
-CACHE_FILE = os.getenv("CACHE_FILE", ".event_cache.json")
+CACHE_FILE = _get("CACHE_FILE", ".event_cache.json")
 
 # How many days to keep cached entries
-CACHE_EXPIRY_DAYS = int(os.getenv("CACHE_EXPIRY_DAYS", "7"))
+CACHE_EXPIRY_DAYS = _get("CACHE_EXPIRY_DAYS", 7, int)
 
 # State file to detect new events (skip full scrape when no new events)
 STATE_FILE = os.path.join(OUTPUT_DIR, ".last_upcoming.json")
@@ -92,13 +111,13 @@ NOTIFICATIONS: Dict[str, Any] = {
 # ============================================================================
 # METRICS (#37)
 # ============================================================================
-METRICS_ENABLED = os.environ.get("METRICS_ENABLED", "true").lower() in ("1", "true", "yes")
-METRICS_FILE = os.environ.get("METRICS_FILE", ".metrics")
+METRICS_ENABLED = _get("METRICS_ENABLED", True, _bool)
+METRICS_FILE = _get("METRICS_FILE", ".metrics")
 
 # ============================================================================
 # CACHE DIRECTORY (#45)
 # ============================================================================
-CACHE_DIR = os.environ.get("CACHE_DIR", "")
+CACHE_DIR = _get("CACHE_DIR", "")
 if CACHE_DIR:
     CACHE_FILE = os.path.join(CACHE_DIR, os.path.basename(CACHE_FILE))
     STATE_FILE = os.path.join(CACHE_DIR, os.path.basename(STATE_FILE))
@@ -107,13 +126,13 @@ if CACHE_DIR:
 # ============================================================================
 # PUSHOVER NOTIFICATIONS (#40)
 # ============================================================================
-PUSHOVER_ENABLED = os.environ.get("PUSHOVER_TOKEN") is not None and os.environ.get("PUSHOVER_USER") is not None
+PUSHOVER_ENABLED = "PUSHOVER_TOKEN" in _ENV and "PUSHOVER_USER" in _ENV
 
 # ============================================================================
 # WEB SUBSCRIPTION LINK (#34)
 # ============================================================================
 # Public URL where ICS file will be hosted (for webcal:// link generation)
-SITE_URL = os.environ.get("SITE_URL", os.environ.get("CALENDAR_SITE_URL", ""))
+SITE_URL = _get("SITE_URL", _get("CALENDAR_SITE_URL", ""))
 
 # ============================================================================
 # HTML GENERATION SETTINGS
@@ -214,4 +233,4 @@ MAX_EVENTS = 0
 
 # Timezone for events without timezone info (ISO format, e.g., "UTC", "Europe/London")
 DEFAULT_TIMEZONE = "UTC"
-GENERATE_EVENT_PAGES = os.environ.get("GENERATE_EVENT_PAGES", "false").lower() in ("1", "true", "yes")
+GENERATE_EVENT_PAGES = _get("GENERATE_EVENT_PAGES", False, _bool)
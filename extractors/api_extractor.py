@@ -7,14 +7,36 @@ Example usage:
 
     events = extract_events_from_api(config)
 """
+import json
 import logging
-from typing import Any, Dict, List
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List, Optional
 
-import requests
+from utils import RateLimiter
+
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
 
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=1)
+def _session() -> "requests.Session":
+    """Return a shared Session so repeated API calls reuse pooled connections."""
+    import requests
+    from requests.adapters import HTTPAdapter
+
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=10, pool_maxsize=20, max_retries=0)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
 def extract_events_from_api(config: Dict[str, Any]) -> List[Dict[str, Any]]:
     """Extract events from a REST API endpoint.
 
@@ -39,26 +61,28 @@ def extract_events_from_api(config: Dict[str, Any]) -> List[Dict[str, Any]]:
         logger.error("API endpoint not configured")
         return []
 
+    import requests
+
     try:
-        response = requests.get(endpoint, headers=headers, params=params, timeout=60)
+        response = _session().get(endpoint, headers=headers, params=params, timeout=60)
         response.raise_for_status()
-        data = response.json()
+        data = _loads(response.content)
     except requests.RequestException as e:
-        logger.error(f"API request failed: {e}")
+        logger.error("API request failed: %s", e)
         return []
     except ValueError as e:
-        logger.error(f"Failed to parse API response as JSON: {e}")
+        logger.error("Failed to parse API response as JSON: %s", e)
         return []
 
-    # Navigate to events array
+    # Navigate to events array (an empty path means the response is the array)
     current = data
-    for key in response_path:
+    for idx, key in enumerate(response_path):
         if not isinstance(current, dict):
-            logger.error(f"Expected dict at path {response_path[:response_path.index(key)]}")
+            logger.error("Expected dict at path %s", response_path[:idx])
             return []
         current = current.get(key)
         if current is None:
-            logger.warning(f"Path {response_path} not found in API response")
+            logger.warning("Path %s not found in API response", response_path)
             return []
 
     if isinstance(current, list):
@@ -67,17 +91,19 @@ def extract_events_from_api(config: Dict[str, Any]) -> List[Dict[str, Any]]:
         # If API returns a dict with events key
         events = current.get("events", [])
     else:
-        logger.error(f"Events data is not a list or dict: {type(current)}")
+        logger.error("Events data is not a list or dict: %s", type(current))
         return []
 
     if not isinstance(events, list):
         events = []
 
-    logger.info(f"Extracted {len(events)} events from API")
+    logger.info("Extracted %d events from API", len(events))
     return events
 
 
-def extract_event_from_api(event_id: str, config: Dict[str, Any]) -> Dict[str, Any]:
+def extract_event_from_api(
+    event_id: str, config: Dict[str, Any], fields: Optional[Iterable[str]] = None
+) -> Dict[str, Any]:
     """Extract full event data from API detail endpoint.
 
     Args:
@@ -85,6 +111,7 @@ def extract_event_from_api(event_id: str, config: Dict[str, Any]) -> Dict[str, A
         config: Configuration dict with:
             - api_detail_endpoint: Endpoint template (e.g., "https://api.com/events/{id}")
             - api_headers: Request headers
+        fields: Optional keys to keep; other keys in the response are dropped
 
     Returns:
         Event dict with enriched data
@@ -95,12 +122,52 @@ def extract_event_from_api(event_id: str, config: Dict[str, Any]) -> Dict[str, A
     if not endpoint_template:
         return {}
 
+    import requests
+
     endpoint = endpoint_template.format(id=event_id)
 
     try:
-        response = requests.get(endpoint, headers=headers, timeout=60)
+        response = _session().get(endpoint, headers=headers, timeout=60)
         response.raise_for_status()
-        return response.json()
+        data = _loads(response.content)
     except requests.RequestException as e:
-        logger.warning(f"Failed to fetch event detail {event_id}: {e}")
+        logger.warning("Failed to fetch event detail %s: %s", event_id, e)
+        return {}
+    except ValueError as e:
+        logger.warning("Failed to parse event detail %s as JSON: %s", event_id, e)
         return {}
+
+    if fields is not None and isinstance(data, dict):
+        return {key: data[key] for key in fields if key in data}
+    return data
+
+
+def extract_events_detail_batch(
+    event_ids: Iterable[str], config: Dict[str, Any], fields: Optional[Iterable[str]] = None
+) -> Dict[str, Dict[str, Any]]:
+    """Fetch detail data for many events concurrently.
+
+    Requests are spread over a thread pool sharing the pooled session and
+    started no more often than once per ``fetch_delay_sec``.
+
+    Args:
+        event_ids: Event identifiers to fetch
+        config: Same as extract_event_from_api, plus:
+            - api_max_workers: Maximum concurrent requests (default: 8)
+            - fetch_delay_sec: Minimum seconds between request starts (default: 0)
+        fields: Optional keys to keep from each detail response
+
+    Returns:
+        Dict mapping each event identifier to its detail dict ({} on failure)
+    """
+    limiter = RateLimiter(config.get("fetch_delay_sec", 0))
+    if fields is not None:
+        fields = tuple(fields)
+
+    def fetch(event_id: str) -> Dict[str, Any]:
+        limiter.wait()
+        return extract_event_from_api(event_id, config, fields)
+
+    with ThreadPoolExecutor(max_workers=config.get("api_max_workers", 8)) as executor:
+        futures = {executor.submit(fetch, event_id): event_id for event_id in event_ids}
+        return {futures[future]: future.result() for future in as_completed(futures)}
@@ -3,6 +3,7 @@
 Use this when events are in HTML format and need to be parsed with CSS selectors.
 
 Requires: beautifulsoup4 (add to requirements.txt)
+Optional: lxml (pip install lxml) for a much faster parser backend
 
 Example usage:
     from extractors.html_extractor import extract_events_from_page
@@ -10,16 +11,76 @@ Example usage:
     events = extract_events_from_page(html_content, config)
 """
 import logging
-from typing import Any, Dict, List
+import re
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Optional
 
-try:
-    from bs4 import BeautifulSoup
-except ImportError:
-    BeautifulSoup = None
-    logging.warning("BeautifulSoup4 not installed. Install with: pip install beautifulsoup4")
+from utils import has_required_fields
 
 logger = logging.getLogger(__name__)
 
+# "tag", ".class" or "tag.class" - selectors that map directly onto Tag.find()
+_SIMPLE_SELECTOR = re.compile(r"^([A-Za-z][\w-]*)?(?:\.([\w-]+))?$")
+
+
+@lru_cache(maxsize=1)
+def _soup_class() -> Optional[type]:
+    """Import BeautifulSoup on first use. Returns None if it is not installed."""
+    try:
+        from bs4 import BeautifulSoup
+    except ImportError:
+        logger.error("BeautifulSoup4 is required for HTML extraction. Install with: pip install beautifulsoup4")
+        return None
+    return BeautifulSoup
+
+
+@lru_cache(maxsize=1)
+def _parser() -> str:
+    """Return the fastest installed BeautifulSoup parser backend."""
+    try:
+        import lxml  # noqa: F401
+    except ImportError:
+        return "html.parser"
+    return "lxml"
+
+
+@lru_cache(maxsize=8)
+def parse_html(html: str) -> Any:
+    """Parse ``html`` into a BeautifulSoup tree, reusing recent parses of the same page.
+
+    The returned tree is shared between callers, so treat it as read-only.
+    Returns None if BeautifulSoup4 is not installed.
+    """
+    BeautifulSoup = _soup_class()
+    if BeautifulSoup is None:
+        return None
+    return BeautifulSoup(html, _parser())
+
+
+@lru_cache(maxsize=32)
+def _css(selector: str) -> "soupsieve.SoupSieve":
+    """Compile a CSS selector once and reuse it for every container and page."""
+    import soupsieve
+
+    return soupsieve.compile(selector)
+
+
+@lru_cache(maxsize=32)
+def _finder(selector: str) -> Callable[[Any], Any]:
+    """Return a function finding the first match for ``selector`` under an element.
+
+    Simple selectors use Tag.find() directly, skipping the CSS engine;
+    anything more complex falls back to the compiled soupsieve selector.
+    """
+    match = _SIMPLE_SELECTOR.match(selector.strip())
+    if match and any(match.groups()):
+        tag, class_ = match.groups()
+        tag = tag.lower() if tag else None
+        if class_:
+            return lambda element: element.find(tag, class_=class_)
+        return lambda element: element.find(tag)
+    return _css(selector).select_one
+
 
 def extract_events_from_page(html: str, config: Dict[str, Any]) -> List[Dict[str, Any]]:
     """Extract events from HTML using BeautifulSoup.
@@ -35,54 +96,54 @@ def extract_events_from_page(html: str, config: Dict[str, Any]) -> List[Dict[str
             - html_location_selector: Selector for location (default: ".location")
             - html_description_selector: Selector for description (default: ".description")
             - html_url_selector: Selector for event URL (default: "a")
+            - required_event_fields: Fields an event must have to be kept (default: ["title"])
 
     Returns:
         List of event dicts
     """
-    if BeautifulSoup is None:
-        logger.error("BeautifulSoup4 is required for HTML extraction")
+    soup = parse_html(html)
+    if soup is None:
         return []
 
-    soup = BeautifulSoup(html, "html.parser")
-
-    # Get selectors from config
-    container_selector = config.get("html_event_container", ".event")
-    title_selector = config.get("html_title_selector", "h2")
-    date_selector = config.get("html_date_selector", ".date")
-    location_selector = config.get("html_location_selector", ".location")
-    description_selector = config.get("html_description_selector", ".description")
-    url_selector = config.get("html_url_selector", "a")
+    # Resolve selectors from config once, before walking the containers
+    container_selector = _css(config.get("html_event_container", ".event"))
+    find_title = _finder(config.get("html_title_selector", "h2"))
+    find_date = _finder(config.get("html_date_selector", ".date"))
+    find_location = _finder(config.get("html_location_selector", ".location"))
+    find_description = _finder(config.get("html_description_selector", ".description"))
+    find_url = _finder(config.get("html_url_selector", "a"))
+    required = frozenset(config.get("required_event_fields", ["title"]))
 
     events = []
-    event_containers = soup.select(container_selector)
+    event_containers = container_selector.select(soup)
 
     for container in event_containers:
         event = {}
 
         # Extract title
-        title_elem = container.select_one(title_selector)
+        title_elem = find_title(container)
         if title_elem:
             event["title"] = title_elem.get_text(strip=True)
 
         # Extract date
-        date_elem = container.select_one(date_selector)
+        date_elem = find_date(container)
         if date_elem:
             event["date_text"] = date_elem.get_text(strip=True)
             # You'll need to parse this into start_at/end_at
             # See utils.parse_date_from_text() for help
 
         # Extract location
-        location_elem = container.select_one(location_selector)
+        location_elem = find_location(container)
         if location_elem:
             event["location"] = location_elem.get_text(strip=True)
 
         # Extract description
-        desc_elem = container.select_one(description_selector)
+        desc_elem = find_description(container)
         if desc_elem:
             event["description"] = desc_elem.get_text(strip=True)
 
         # Extract URL
-        url_elem = container.select_one(url_selector)
+        url_elem = find_url(container)
         if url_elem:
             href = url_elem.get("href", "")
             base_url = config.get("base_url", "")
@@ -92,11 +153,11 @@ def extract_events_from_page(html: str, config: Dict[str, Any]) -> List[Dict[str
                 else:
                     event["url"] = f"{base_url.rstrip('/')}/{href.lstrip('/')}"
 
-        # Only add if we have at least a title
-        if event.get("title"):
+        # Only add if the required fields (by default just a title) are set
+        if has_required_fields(event, required):
             events.append(event)
 
-    logger.info(f"Extracted {len(events)} events from HTML")
+    logger.info("Extracted %d events from HTML", len(events))
     return events
 
 
@@ -112,10 +173,10 @@ def extract_event_from_detail_page(html: str, config: Dict[str, Any]) -> Dict[st
     Returns:
         Event dict with enriched data
     """
-    if BeautifulSoup is None:
+    soup = parse_html(html)
+    if soup is None:
         return {}
 
-    soup = BeautifulSoup(html, "html.parser")
     event = {}
 
     # Customize these selectors for your detail page
@@ -6,6 +6,10 @@ Common examples:
 - React/Next.js server-side rendered data
 - JSON-LD structured data
 
+Optional: orjson (pip install orjson) speeds up parsing. Without it, ijson
+(pip install ijson) streams only the configured json_path out of large
+payloads instead of loading the whole document.
+
 Example usage:
     from extractors.json_extractor import extract_events_from_page
 
@@ -13,12 +17,71 @@ Example usage:
 """
 import json
 import logging
-import re
-from typing import Any, Dict, List
+from functools import lru_cache
+from itertools import chain
+from typing import Any, Dict, List, Optional
+
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
 
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=1)
+def _ijson() -> Any:
+    """Import ijson on first use. Returns None if it is not installed."""
+    try:
+        import ijson
+    except ImportError:
+        return None
+    return ijson
+
+
+def _find_script_payload(html: str, script_id: str) -> Optional[str]:
+    """Return the raw contents of the JSON <script> tag with ``script_id``.
+
+    Uses plain substring search rather than a DOTALL regex so multi-megabyte
+    pages are scanned once without backtracking.
+    """
+    opening = f'<script id="{script_id}" type="application/json">'
+    start = html.find(opening)
+    if start == -1:
+        return None
+    start += len(opening)
+    end = html.find("</script>", start)
+    if end == -1:
+        return None
+    return html[start:end]
+
+
+def _stream_path(payload: str, path: List[str]) -> Any:
+    """Return the value at ``path`` in ``payload`` via ijson, or None.
+
+    Only the subtree under ``path`` is built into Python objects; parsing stops
+    as soon as it has been read. Returns None, so the caller parses the whole
+    document instead, when orjson is installed (it is faster), when a key
+    cannot be written as an ijson prefix (contains "." or is "item"), when
+    the path is not found, or when ijson rejects the payload (e.g. integers
+    wider than 64 bits with the C backend).
+    """
+    if _loads is not json.loads or not path:
+        return None
+    if not all(isinstance(key, str) and key and "." not in key and key != "item" for key in path):
+        return None
+    ijson = _ijson()
+    if ijson is None:
+        return None
+    try:
+        for value in ijson.items(payload.encode("utf-8"), ".".join(path), use_float=True):
+            return value
+    except ijson.JSONError:
+        pass
+    return None
+
+
 def extract_events_from_page(html: str, config: Dict[str, Any]) -> List[Dict[str, Any]]:
     """Extract events from JSON embedded in HTML page.
 
@@ -41,30 +104,32 @@ def extract_events_from_page(html: str, config: Dict[str, Any]) -> List[Dict[str
     past_key = config.get("json_past_key", "past")
 
     # Find JSON script tag
-    pattern = rf'<script id="{re.escape(script_id)}" type="application/json">(.+?)</script>'
-    match = re.search(pattern, html, re.DOTALL)
-    if not match:
-        logger.error(f"Could not find script tag with id '{script_id}'")
+    payload = _find_script_payload(html, script_id)
+    if payload is None:
+        logger.error("Could not find script tag with id '%s'", script_id)
         return []
 
-    # Parse JSON
-    try:
-        data = json.loads(match.group(1))
-    except json.JSONDecodeError as e:
-        logger.error(f"Failed to parse JSON: {e}")
-        return []
-
-    # Navigate to events using json_path
-    current = data
-    for key in json_path:
-        if not isinstance(current, dict):
-            logger.error(f"Expected dict at path {json_path[:json_path.index(key)]}")
-            return []
-        current = current.get(key)
-        if current is None:
-            logger.warning(f"Path {json_path} not found in JSON")
+    # Stream straight to json_path when possible, skipping unrelated subtrees
+    current = _stream_path(payload, json_path)
+    if current is None:
+        # Parse JSON
+        try:
+            data = _loads(payload)
+        except json.JSONDecodeError as e:
+            logger.error("Failed to parse JSON: %s", e)
             return []
 
+        # Navigate to events using json_path (empty path: events are the document)
+        current = data
+        for idx, key in enumerate(json_path):
+            if not isinstance(current, dict):
+                logger.error("Expected dict at path %s", json_path[:idx])
+                return []
+            current = current.get(key)
+            if current is None:
+                logger.warning("Path %s not found in JSON", json_path)
+                return []
+
     # Extract upcoming and past events
     if isinstance(current, dict):
         upcoming = current.get(upcoming_key, [])
@@ -74,7 +139,7 @@ def extract_events_from_page(html: str, config: Dict[str, Any]) -> List[Dict[str
         upcoming = current
         past = []
     else:
-        logger.error(f"Events data is not a dict or list: {type(current)}")
+        logger.error("Events data is not a dict or list: %s", type(current))
         return []
 
     # Ensure lists
@@ -85,21 +150,23 @@ def extract_events_from_page(html: str, config: Dict[str, Any]) -> List[Dict[str
 
     # Merge and deduplicate
     seen = set()
+    seen_add = seen.add
     merged = []
-    for event in upcoming + past:
+    merged_append = merged.append
+    for event in chain(upcoming, past):
         if not isinstance(event, dict):
             continue
 
         # Use slug or id for deduplication
         identifier = event.get("slug") or event.get("id") or event.get("title")
-        if identifier and identifier in seen:
-            continue
         if identifier:
-            seen.add(identifier)
+            if identifier in seen:
+                continue
+            seen_add(identifier)
 
-        merged.append(event)
+        merged_append(event)
 
-    logger.info(f"Extracted {len(merged)} events from JSON")
+    logger.info("Extracted %d events from JSON", len(merged))
     return merged
 
 
@@ -119,25 +186,26 @@ def extract_event_from_detail_page(html: str, config: Dict[str, Any]) -> Dict[st
     detail_path = config.get("json_detail_path", ["props", "pageProps", "event"])
 
     # Find JSON script tag
-    pattern = rf'<script id="{re.escape(script_id)}" type="application/json">(.+?)</script>'
-    match = re.search(pattern, html, re.DOTALL)
-    if not match:
+    payload = _find_script_payload(html, script_id)
+    if payload is None:
         return {}
 
-    try:
-        data = json.loads(match.group(1))
-    except json.JSONDecodeError:
-        return {}
-
-    # Navigate to event data
-    current = data
-    for key in detail_path:
-        if not isinstance(current, dict):
-            return {}
-        current = current.get(key)
-        if current is None:
+    current = _stream_path(payload, detail_path)
+    if current is None:
+        try:
+            data = _loads(payload)
+        except json.JSONDecodeError:
             return {}
 
+        # Navigate to event data
+        current = data
+        for key in detail_path:
+            if not isinstance(current, dict):
+                return {}
+            current = current.get(key)
+            if current is None:
+                return {}
+
     if isinstance(current, dict):
         return current
 
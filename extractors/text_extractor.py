@@ -11,12 +11,26 @@ Example usage:
 import datetime
 import logging
 import re
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 
-from utils import parse_date_from_text, parse_time_from_text
+from utils import compile_pattern, has_required_fields, parse_date_from_text, parse_time_from_text
 
 logger = logging.getLogger(__name__)
 
+# Each non-blank line with surrounding whitespace trimmed, found in one scan
+_LINE_RE = re.compile(r"^[^\S\n]*(\S(?:.*\S)?)[^\S\n]*$", re.MULTILINE)
+
+
+def _set_start_at(
+    event: Dict[str, Any],
+    date: Optional[datetime.date],
+    time: Optional[datetime.time],
+) -> None:
+    """Store the event's date, combined with its time if one was found, as start_at."""
+    if date:
+        start = datetime.datetime.combine(date, time) if time else date
+        event["start_at"] = start.isoformat()
+
 
 def extract_events_from_page(text: str, config: Dict[str, Any]) -> List[Dict[str, Any]]:
     """Extract events from plain text using regex patterns.
@@ -28,8 +42,10 @@ def extract_events_from_page(text: str, config: Dict[str, Any]) -> List[Dict[str
         config: Configuration dict with extraction settings:
             - text_date_pattern: Regex pattern for dates (default: r"(\\d{1,2})\\s+([A-Za-z]+)\\s+(\\d{4})")
             - text_title_pattern: Regex pattern for titles (default: r"^(.+?)\\s*-\\s*")
-            - text_line_pattern: Regex pattern for entire event line (optional)
+            - text_line_pattern: Regex pattern for entire event line (optional,
+              matched in MULTILINE mode so ^ and $ anchor at line boundaries)
             - base_url: Base URL for building absolute URLs
+            - required_event_fields: Fields an event must have to be kept (default: ["title"])
 
     Returns:
         List of event dicts
@@ -37,66 +53,63 @@ def extract_events_from_page(text: str, config: Dict[str, Any]) -> List[Dict[str
     date_pattern = config.get("text_date_pattern", r"(\d{1,2})\s+([A-Za-z]+)\s+(\d{4})")
     title_pattern = config.get("text_title_pattern", r"^(.+?)\s*-\s*")
     line_pattern = config.get("text_line_pattern", None)
+    date_re = compile_pattern(date_pattern)
+    title_re = compile_pattern(title_pattern)
     base_url = config.get("base_url", "")
+    required = frozenset(config.get("required_event_fields", ["title"]))
 
     events = []
-    lines = text.split("\n")
 
     # If a line pattern is provided, use it
     if line_pattern:
-        for line in lines:
-            match = re.search(line_pattern, line)
-            if match:
-                event = {}
-                # Extract groups from match
-                # Customize based on your pattern
-                # Example:
-                # event["title"] = match.group(1)
-                # event["date_text"] = match.group(2)
-                # event["location"] = match.group(3)
-                if event.get("title"):
-                    events.append(event)
+        line_re = compile_pattern(line_pattern, re.MULTILINE)
+        for match in line_re.finditer(text):
+            event = {}
+            # Extract groups from match
+            # Customize based on your pattern
+            # Example:
+            # event["title"] = match.group(1)
+            # event["date_text"] = match.group(2)
+            # event["location"] = match.group(3)
+            if has_required_fields(event, required):
+                events.append(event)
     else:
-        # Parse line by line looking for date patterns
+        # Parse line by line looking for date patterns. The date and time are
+        # kept as objects and only serialized to start_at when the event ends.
         current_event = {}
-        for line in lines:
-            line = line.strip()
-            if not line:
-                continue
+        current_date = None
+        current_time = None
+        for line_match in _LINE_RE.finditer(text):
+            line = line_match.group(1)
 
             # Try to find date
-            date_match = re.search(date_pattern, line)
+            date_match = date_re.search(line)
             if date_match:
                 # Save previous event if exists
-                if current_event.get("title"):
+                _set_start_at(current_event, current_date, current_time)
+                if has_required_fields(current_event, required):
                     events.append(current_event)
                 current_event = {}
-                date_obj = parse_date_from_text(line, date_pattern)
-                if date_obj:
-                    current_event["start_at"] = date_obj.isoformat()
+                current_date = parse_date_from_text(line, date_pattern)
+                current_time = None
 
             # Try to find title
-            title_match = re.search(title_pattern, line)
+            title_match = title_re.search(line)
             if title_match:
                 current_event["title"] = title_match.group(1).strip()
 
-            # Try to find time
-            time_obj = parse_time_from_text(line)
-            if time_obj:
-                # Combine with date if we have one
-                if current_event.get("start_at"):
-                    try:
-                        date_obj = datetime.datetime.fromisoformat(current_event["start_at"])
-                        dt = datetime.datetime.combine(date_obj.date(), time_obj)
-                        current_event["start_at"] = dt.isoformat()
-                    except (ValueError, AttributeError):
-                        pass
+            # Try to find time (every supported time format contains a colon)
+            time_obj = parse_time_from_text(line) if ":" in line else None
+            if time_obj and current_date:
+                # Combined with the date when the event is saved
+                current_time = time_obj
 
         # Don't forget the last event
-        if current_event.get("title"):
+        _set_start_at(current_event, current_date, current_time)
+        if has_required_fields(current_event, required):
             events.append(current_event)
 
-    logger.info(f"Extracted {len(events)} events from text")
+    logger.info("Extracted %d events from text", len(events))
     return events
 
 
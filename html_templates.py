@@ -6,6 +6,12 @@ import datetime
 import html as _html
 
 import json
+from itertools import groupby
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 def _esc(text: str) -> str:
     """HTML-escape text for safe insertion into HTML."""
@@ -13,7 +19,39 @@ def _esc(text: str) -> str:
 from typing import Any, Dict, List, Optional
 
 import config
-from utils import parse_iso_datetime, strip_html
+from utils import parse_iso_datetime, strip_html_truncated
+
+_MONTH_NAMES = (
+    "January", "February", "March", "April", "May", "June",
+    "July", "August", "September", "October", "November", "December",
+)
+_MONTH_ABBRS = tuple(name[:3] for name in _MONTH_NAMES)
+
+# Health status -> (emoji, CSS class); anything else is shown as an error
+_STATUS_MAP = {
+    "success": ("✅", "success"),
+    "partial": ("⚠️", "warning"),
+}
+_STATUS_UNKNOWN = ("❌", "error")
+
+
+def _format_date(dt: datetime.datetime) -> str:
+    """Format a date as "DD Mon YYYY" (e.g. "05 Mar 2026") without strftime."""
+    return f"{dt.day:02d} {_MONTH_ABBRS[dt.month - 1]} {dt.year}"
+
+
+def _ellipsize(text: str, limit: int) -> str:
+    """Cut text to limit characters, marking the cut with "..."."""
+    return text if len(text) <= limit else text[:limit] + "..."
+
+
+def _dumps_compact(data: Any) -> str:
+    """Serialize data as compact JSON that is safe to embed in a <script> block."""
+    if orjson is not None:
+        text = orjson.dumps(data).decode()
+    else:
+        text = json.dumps(data, separators=(",", ":"), ensure_ascii=False)
+    return text.replace("</", "<\\/")
 
 
 def build_index_html(
@@ -37,9 +75,12 @@ def build_index_html(
         message = health_status.get("message", "")
         error = health_status.get("error")
 
-        if last_update:
+        if not last_update:
+            time_ago = "unknown"
+        elif (update_dt := parse_iso_datetime(last_update)) is None:
+            time_ago = "recently"
+        else:
             try:
-                update_dt = datetime.datetime.fromisoformat(last_update.replace("Z", "+00:00"))
                 now = datetime.datetime.now(datetime.timezone.utc)
                 delta = now - update_dt
                 if delta.total_seconds() < 3600:
@@ -48,13 +89,11 @@ def build_index_html(
                     time_ago = f"{int(delta.total_seconds() / 3600)} hours ago"
                 else:
                     time_ago = f"{int(delta.total_seconds() / 86400)} days ago"
-            except (ValueError, TypeError):
+            except TypeError:
+                # Naive timestamp can't be compared with an aware "now"
                 time_ago = "recently"
-        else:
-            time_ago = "unknown"
 
-        status_emoji = "✅" if status == "success" else ("⚠️" if status == "partial" else "❌")
-        status_class = "success" if status == "success" else ("warning" if status == "partial" else "error")
+        status_emoji, status_class = _STATUS_MAP.get(status, _STATUS_UNKNOWN)
 
         health_html = f'''
     <div class="health-status {status_class}">
@@ -71,50 +110,55 @@ def build_index_html(
     events_json_data = []
     if events:
         today = datetime.datetime.now(datetime.timezone.utc)
-        upcoming_first = []
-        past = []
+        # Naive starts are UTC; compare them with a naive "today" rather than
+        # building an aware copy of every start
+        today_naive = today.replace(tzinfo=None)
+        # One pass parses each start and renders its card body and modal data
+        # into the upcoming or past lists; undated events go with upcoming ones
+        upcoming_cards, upcoming_data = [], []
+        past_cards, past_data = [], []
         for e in events:
             start = parse_iso_datetime(e.get("start_at"))
             if start:
-                s = start.replace(tzinfo=datetime.timezone.utc) if start.tzinfo is None else start
-                (upcoming_first if s >= today else past).append(e)
+                is_upcoming = start >= (today_naive if start.tzinfo is None else today)
+                date_str = _format_date(start)
+                time_str = f"{start.hour:02d}:{start.minute:02d}"
             else:
-                upcoming_first.append(e)
-        ordered = upcoming_first + past
-
-        featured_items = []
-        for idx, e in enumerate(ordered):
-            start = parse_iso_datetime(e.get("start_at"))
-            date_str = start.strftime("%d %b %Y") if start else ""
-            time_str = start.strftime("%H:%M") if start else ""
+                is_upcoming = False
+                date_str = time_str = ""
             title = e.get("title", "Event")
             location = e.get("location", "")
-            description = strip_html(e.get("description", ""))[:200]
+            description = strip_html_truncated(e.get("description", ""), 200)
             slug = e.get("slug", "")
             url = f"{config.BASE_URL}/events/{slug}" if slug else e.get("url", "")
 
-            is_upcoming = start and (start.replace(tzinfo=datetime.timezone.utc) if start.tzinfo is None else start) >= today
-
-            events_json_data.append({
-                "title": title,
-                "date": date_str,
-                "time": time_str,
-                "location": location,
-                "description": description,
-                "url": url,
-                "upcoming": is_upcoming,
+            if is_upcoming or not start:
+                cards, data = upcoming_cards, upcoming_data
+            else:
+                cards, data = past_cards, past_data
+            # Short keys keep the embedded payload small; see showEventModal()
+            data.append({
+                "t": title,
+                "d": f"{date_str} {time_str}",
+                "l": location,
+                "s": description,
+                "u": url,
+                "p": is_upcoming,
             })
-
-            featured_items.append(
-                f'<div class="featured-event" data-event-idx="{idx}" onclick="showEventModal({idx})">'
+            cards.append(
                 f'<div class="event-content">'
                 f'<span class="date">{date_str}</span>'
                 f'<span class="title">{_esc(title)}</span>'
-                f'<span class="location-small">📍 {location[:50]}{"..." if len(location) > 50 else ""}</span>'
+                f'<span class="location-small">📍 {_esc(_ellipsize(location, 50))}</span>'
                 f'</div>'
-                f"</div>"
             )
-        featured_html = "\n        ".join(featured_items)
+
+        events_json_data = upcoming_data + past_data
+        # Card indices follow the final order, so they are added when joining
+        featured_html = "\n        ".join(
+            f'<div class="featured-event" data-event-idx="{idx}" onclick="showEventModal({idx})">{card}</div>'
+            for idx, card in enumerate(upcoming_cards + past_cards)
+        )
 
     # CUSTOMIZE: Update colors, fonts, and branding here
     return f"""<!DOCTYPE html>
@@ -261,14 +305,15 @@ def build_index_html(
   </div>
 
   <script>
-  const eventsData = {json.dumps(events_json_data)};
+  // t=title, d=date and time, l=location, s=summary, u=url, p=upcoming
+  const eventsData = {_dumps_compact(events_json_data)};
   function showEventModal(idx) {{
     const event = eventsData[idx];
-    document.getElementById('modalTitle').textContent = event.title;
-    document.getElementById('modalDate').textContent = event.date + ' ' + event.time;
-    document.getElementById('modalLocation').textContent = event.location;
-    document.getElementById('modalDescription').textContent = event.description;
-    document.getElementById('modalLink').href = event.url;
+    document.getElementById('modalTitle').textContent = event.t;
+    document.getElementById('modalDate').textContent = event.d;
+    document.getElementById('modalLocation').textContent = event.l;
+    document.getElementById('modalDescription').textContent = event.s;
+    document.getElementById('modalLink').href = event.u;
     document.getElementById('eventModal').classList.add('active');
   }}
   function closeModal() {{
@@ -284,35 +329,30 @@ def build_archive_html(past_events: List[Dict[str, Any]]) -> str:
     if not past_events:
         events_html = '<p class="no-events">No past events in archive yet.</p>'
     else:
-        events_by_year_month = {}
+        dated = []
         for e in past_events:
             start = parse_iso_datetime(e.get("start_at"))
-            if not start:
-                continue
-            year = start.year
-            month = start.strftime("%B")
-            key = (year, month, start.month)
-            if key not in events_by_year_month:
-                events_by_year_month[key] = []
-            events_by_year_month[key].append((e, start))
-
-        sorted_groups = sorted(events_by_year_month.items(), key=lambda x: (x[0][0], x[0][2]), reverse=True)
-
-        events_html = ""
-        for (year, month_name, _), events_list in sorted_groups:
-            events_html += f'<div class="archive-group"><h3>{month_name} {year}</h3><div class="archive-events">'
-            events_list.sort(key=lambda x: x[1], reverse=True)
+            if start:
+                dated.append((e, start))
+        # One sort (newest first) orders both the month groups and the events
+        # within them; year/month lead the key so naive and aware starts only
+        # meet when they share a month
+        dated.sort(key=lambda x: (x[1].year, x[1].month, x[1]), reverse=True)
+
+        parts = []
+        for (year, month), events_list in groupby(dated, key=lambda x: (x[1].year, x[1].month)):
+            parts.append(f'<div class="archive-group"><h3>{_MONTH_NAMES[month - 1]} {year}</h3><div class="archive-events">')
             for event, start in events_list:
                 title = event.get("title", "Untitled Event")
                 location = event.get("location", "")
-                date_str = start.strftime("%d %b %Y")
+                date_str = _format_date(start)
                 slug = event.get("slug", "")
                 url = f"{config.BASE_URL}/events/{slug}" if slug else ""
 
                 location_html = f'<span class="location">{_esc(location)}</span>' if location else ''
                 link_html = f'<a href="{_esc(url)}" target="_blank">View details →</a>' if url else ''
 
-                events_html += f'''
+                parts.append(f'''
         <div class="archive-event">
           <div class="archive-date">{date_str}</div>
           <div class="archive-details">
@@ -320,8 +360,9 @@ def build_archive_html(past_events: List[Dict[str, Any]]) -> str:
             {location_html}
           </div>
           {link_html}
-        </div>'''
-            events_html += '</div></div>'
+        </div>''')
+            parts.append('</div></div>')
+        events_html = "".join(parts)
 
     return f"""<!DOCTYPE html>
 <html lang="en">
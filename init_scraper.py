@@ -86,8 +86,8 @@ def main():
 
     # Replace placeholders
     replacements = {
-        "EVENTS_URL = os.getenv(\"EVENTS_URL\", \"https://example.com/events\")": f"EVENTS_URL = os.getenv(\"EVENTS_URL\", \"{events_url}\")",
-        "BASE_URL = os.getenv(\"BASE_URL\", \"https://example.com\")": f"BASE_URL = os.getenv(\"BASE_URL\", \"{base_url}\")",
+        "EVENTS_URL = _get(\"EVENTS_URL\", \"https://example.com/events\")": f"EVENTS_URL = _get(\"EVENTS_URL\", \"{events_url}\")",
+        "BASE_URL = _get(\"BASE_URL\", \"https://example.com\")": f"BASE_URL = _get(\"BASE_URL\", \"{base_url}\")",
         "CALENDAR_NAME = \"{{CALENDAR_NAME}}\"": f"CALENDAR_NAME = \"{calendar_name}\"",
         "CALENDAR_DESCRIPTION = \"{{CALENDAR_DESCRIPTION}}\"": f"CALENDAR_DESCRIPTION = \"{calendar_description}\"",
         "UID_DOMAIN = \"{{UID_DOMAIN}}\"": f"UID_DOMAIN = \"{uid_domain}\"",
@@ -18,11 +18,16 @@ import json
 import logging
 import os
 import sys
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from itertools import islice
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
 
 import requests
+from requests.adapters import HTTPAdapter
 
 try:
     from dotenv import load_dotenv
@@ -32,31 +37,65 @@ except ImportError:
 
 import config
 from utils import (
+    RateLimiter,
     atomic_write,
+    atomic_write_chunks,
     atomic_write_json,
     escape_and_fold_ical_text,
     format_ical_datetime,
     parse_iso_datetime,
+    read_json,
     strip_html,
 )
 
-# Import extractor based on config
-if config.EXTRACTION_METHOD == "json":
-    from extractors.json_extractor import extract_events_from_page, extract_event_from_detail_page
-elif config.EXTRACTION_METHOD == "html":
-    from extractors.html_extractor import extract_events_from_page, extract_event_from_detail_page
-elif config.EXTRACTION_METHOD == "text":
-    from extractors.text_extractor import extract_events_from_page, extract_event_from_detail_page
-elif config.EXTRACTION_METHOD == "api":
-    from extractors.api_extractor import extract_events_from_api, extract_event_from_api as extract_event_detail_from_api
-    # For API, we don't have a page to extract from
-    def extract_events_from_page(html: str, cfg: Dict[str, Any]) -> List[Dict[str, Any]]:
-        return extract_events_from_api(cfg)
-    def extract_event_from_detail_page(html: str, cfg: Dict[str, Any]) -> Dict[str, Any]:
-        return {}
-else:
+# Extractor modules are imported on first use, so only the configured one
+# (and its dependencies) is ever loaded
+if config.EXTRACTION_METHOD not in ("json", "html", "text", "api"):
     raise ValueError(f"Unknown extraction method: {config.EXTRACTION_METHOD}")
 
+
+@lru_cache(maxsize=1)
+def _get_extractor() -> Tuple[Callable[..., List[Dict[str, Any]]], Callable[..., Dict[str, Any]]]:
+    """Return the (list page, detail page) extractor pair for EXTRACTION_METHOD."""
+    if config.EXTRACTION_METHOD == "json":
+        from extractors.json_extractor import extract_events_from_page, extract_event_from_detail_page
+    elif config.EXTRACTION_METHOD == "html":
+        from extractors.html_extractor import extract_events_from_page, extract_event_from_detail_page
+    elif config.EXTRACTION_METHOD == "text":
+        from extractors.text_extractor import extract_events_from_page, extract_event_from_detail_page
+    else:
+        from extractors.api_extractor import extract_events_from_api
+
+        # For API, we don't have a page to extract from
+        def extract_events_from_page(html: str, cfg: Dict[str, Any]) -> List[Dict[str, Any]]:
+            return extract_events_from_api(cfg)
+
+        def extract_event_from_detail_page(html: str, cfg: Dict[str, Any]) -> Dict[str, Any]:
+            return {}
+    return extract_events_from_page, extract_event_from_detail_page
+
+
+def extract_events_from_page(html: str, cfg: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Extract list-page events with the configured extractor."""
+    return _get_extractor()[0](html, cfg)
+
+
+def extract_event_from_detail_page(html: str, cfg: Dict[str, Any]) -> Dict[str, Any]:
+    """Extract detail-page fields with the configured extractor."""
+    return _get_extractor()[1](html, cfg)
+
+
+def extract_events_from_api(cfg: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Fetch the event list from the API (EXTRACTION_METHOD "api" only)."""
+    from extractors.api_extractor import extract_events_from_api
+    return extract_events_from_api(cfg)
+
+
+def extract_event_detail_from_api(identifier: str, cfg: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """Fetch a single event from the API (EXTRACTION_METHOD "api" only)."""
+    from extractors.api_extractor import extract_event_from_api
+    return extract_event_from_api(identifier, cfg)
+
 # Set up logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -64,12 +103,37 @@ error_handler = logging.FileHandler(config.LOG_FILE)
 error_handler.setLevel(logging.ERROR)
 logger.addHandler(error_handler)
 ICAL_NEWLINE = "\r\n"
+# VCALENDAR preamble; filled in with PRODID, the folded X-WR-CALNAME and
+# X-WR-CALDESC lines, and X-WR-TIMEZONE
+_ICAL_HEADER = ICAL_NEWLINE.join(
+    [
+        "BEGIN:VCALENDAR",
+        "VERSION:2.0",
+        "PRODID:%s",
+        "CALSCALE:GREGORIAN",
+        "METHOD:PUBLISH",
+        "%s",
+        "%s",
+        "X-WR-TIMEZONE:%s",
+        "REFRESH-INTERVAL;VALUE=DURATION:PT12H",
+        "X-PUBLISHED-TTL:PT12H",
+        "",
+    ]
+)
+# Sort key for events without a start time (they sort first)
+_MIN_DT = datetime.datetime.min.replace(tzinfo=datetime.timezone.utc)
 
 
 # ============================================================================
 # HTTP REQUEST HELPERS
 # ============================================================================
 
+# Shared session so the list page and every detail page reuse pooled connections
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=0))
+_SESSION.mount("http://", HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=0))
+
+
 def fetch_with_retries(
     url: str,
     retries: int = config.HTTP_RETRIES,
@@ -81,7 +145,7 @@ def fetch_with_retries(
 
     for attempt in range(retries):
         try:
-            response = requests.get(url, headers=headers, timeout=timeout)
+            response = _SESSION.get(url, headers=headers, timeout=timeout)
             response.raise_for_status()
             return response
         except requests.RequestException as exc:
@@ -132,30 +196,73 @@ def validate_event_data(event: Dict[str, Any]) -> bool:
 # CACHE MANAGEMENT
 # ============================================================================
 
+# Parsed cache/state/health files, memoized for the rest of the run.
+# The matching save_* helper replaces its entry with what it wrote.
+_loaded: Dict[str, Any] = {}
+
+# Set when the in-memory cache differs from CACHE_FILE (new details fetched
+# or expired entries dropped); save_cache() is a no-op while it is False
+_cache_dirty = False
+# Guards cache writes made from fetch_event_details_bulk() worker threads
+_cache_lock = threading.Lock()
+
+
 def load_cache() -> Dict[str, dict]:
-    """Load event detail cache from disk. Drops expired entries."""
-    if not os.path.exists(config.CACHE_FILE):
-        return {}
+    """Load event detail cache from disk. Drops expired entries.
+
+    Memoized for the run; save_cache() refreshes the stored copy.
+    """
+    if "cache" not in _loaded:
+        _loaded["cache"] = _read_cache()
+    return _loaded["cache"]
+
+
+def _read_cache() -> Dict[str, dict]:
+    """Read and expire the event detail cache file."""
+    global _cache_dirty
     try:
-        with open(config.CACHE_FILE, "r", encoding="utf-8") as f:
-            cache = json.load(f)
-        cutoff = (
-            datetime.datetime.now() - datetime.timedelta(days=config.CACHE_EXPIRY_DAYS)
-        ).isoformat()
-        cache = {k: v for k, v in cache.items() if v.get("cached_at", "") > cutoff}
+        cache = read_json(config.CACHE_FILE)
+        cutoff = time.time() - config.CACHE_EXPIRY_DAYS * 86400
+        loaded_count = len(cache)
+        cache = {k: v for k, v in cache.items() if _cached_at(v) > cutoff}
+        if len(cache) != loaded_count:
+            _cache_dirty = True
         logger.info("Loaded event cache with %d entries", len(cache))
         return cache
+    except FileNotFoundError:
+        return {}
     except (json.JSONDecodeError, OSError) as e:
         logger.warning("Cache load failed: %s", e)
         return {}
 
 
+def _cached_at(entry: Dict[str, Any]) -> float:
+    """Epoch seconds an entry was cached (older caches stored an ISO string)."""
+    cached_at = entry.get("cached_at", 0)
+    if isinstance(cached_at, str):
+        try:
+            return datetime.datetime.fromisoformat(cached_at).timestamp()
+        except ValueError:
+            return 0
+    return cached_at
+
+
 def save_cache(cache: Dict[str, dict]) -> None:
-    """Save event detail cache to disk atomically."""
+    """Save event detail cache to disk atomically.
+
+    Skipped when nothing was added or expired since the cache was loaded.
+    """
+    global _cache_dirty
+    if not _cache_dirty and _loaded.get("cache") is cache:
+        logger.info("Event cache unchanged, not rewriting")
+        return
     try:
         atomic_write_json(Path(config.CACHE_FILE), cache)
+        _loaded["cache"] = cache
+        _cache_dirty = False
         logger.info("Saved event cache with %d entries", len(cache))
     except OSError as e:
+        _loaded.pop("cache", None)
         logger.warning("Cache save failed: %s", e)
 
 
@@ -164,34 +271,55 @@ def save_cache(cache: Dict[str, dict]) -> None:
 # ============================================================================
 
 def load_last_upcoming_slugs() -> set:
-    """Load the set of upcoming event slugs from last run."""
-    if not os.path.exists(config.STATE_FILE):
-        return set()
+    """Load the set of upcoming event slugs from last run.
+
+    Memoized for the run; save_last_upcoming_slugs() refreshes the stored copy.
+    """
+    if "slugs" not in _loaded:
+        _loaded["slugs"] = _read_last_upcoming_slugs()
+    return _loaded["slugs"]
+
+
+def _read_last_upcoming_slugs() -> set:
+    """Read the upcoming event slugs from the state file."""
     try:
-        with open(config.STATE_FILE, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        data = read_json(config.STATE_FILE)
         slugs = data.get("slugs", [])
         return set(slugs) if isinstance(slugs, list) else set()
+    except FileNotFoundError:
+        return set()
     except (json.JSONDecodeError, OSError):
         return set()
 
 
-def save_last_upcoming_slugs(slugs: List[str]) -> None:
-    """Save the current upcoming event slugs for next run comparison."""
+def save_last_upcoming_slugs(slugs: Iterable[str]) -> None:
+    """Save the current upcoming event slugs for next run comparison.
+
+    Duplicates are dropped (first occurrence wins) and the file is written compact.
+    """
+    slugs = list(dict.fromkeys(slugs))
     Path(config.OUTPUT_DIR).mkdir(parents=True, exist_ok=True)
     try:
         atomic_write_json(
             Path(config.STATE_FILE),
             {"slugs": slugs, "updated": datetime.datetime.now(datetime.timezone.utc).isoformat()},
+            indent=False,
         )
+        _loaded["slugs"] = set(slugs)
         logger.info("Saved state with %d upcoming slugs", len(slugs))
     except OSError as e:
+        _loaded.pop("slugs", None)
         logger.warning("State save failed: %s", e)
 
 
+def _slug_key(event: Dict[str, Any]) -> Any:
+    """Key identifying an event in the upcoming-slugs state (slug, else id, else title)."""
+    return event.get("slug") or event.get("id") or event.get("title")
+
+
 def has_new_events(current_slugs: set, previous_slugs: set) -> bool:
     """True if there is at least one event in current that was not in previous."""
-    return bool(current_slugs - previous_slugs)
+    return any(slug not in previous_slugs for slug in current_slugs)
 
 
 # ============================================================================
@@ -215,18 +343,29 @@ def save_health_status(
     }
     try:
         atomic_write_json(Path(config.HEALTH_FILE), health_data)
+        _loaded["health"] = health_data
         logger.info("Saved health status: %s", status)
     except OSError as e:
+        _loaded.pop("health", None)
         logger.warning("Health status save failed: %s", e)
 
 
 def load_health_status() -> Optional[Dict[str, Any]]:
-    """Load health status from disk."""
-    if not os.path.exists(config.HEALTH_FILE):
-        return None
+    """Load health status from disk.
+
+    Memoized for the run; save_health_status() refreshes the stored copy.
+    """
+    if "health" not in _loaded:
+        _loaded["health"] = _read_health_status()
+    return _loaded["health"]
+
+
+def _read_health_status() -> Optional[Dict[str, Any]]:
+    """Read the health status file."""
     try:
-        with open(config.HEALTH_FILE, "r", encoding="utf-8") as f:
-            return json.load(f)
+        return read_json(config.HEALTH_FILE)
+    except FileNotFoundError:
+        return None
     except (json.JSONDecodeError, OSError):
         return None
 
@@ -235,6 +374,21 @@ def load_health_status() -> Optional[Dict[str, Any]]:
 # EVENT DETAIL FETCHING
 # ============================================================================
 
+# Extractor settings for detail pages, built once instead of once per event
+_DETAIL_CONFIG = {
+    "json_script_id": config.JSON_SCRIPT_ID,
+    "json_detail_path": config.JSON_PATH + ["event"],
+    "base_url": config.BASE_URL,
+}
+_API_DETAIL_CONFIG = {
+    "api_detail_endpoint": f"{config.BASE_URL}/api/events/{{id}}",
+    "api_headers": config.API_HEADERS,
+}
+
+# Shared across fetch threads so detail requests start at most once per FETCH_DELAY_SEC
+_FETCH_LIMITER = RateLimiter(config.FETCH_DELAY_SEC)
+
+
 def fetch_event_detail(identifier: str, cache: Dict[str, dict]) -> Optional[Dict[str, Any]]:
     """Fetch event detail from its page. Uses cache if available and not expired.
 
@@ -247,6 +401,7 @@ def fetch_event_detail(identifier: str, cache: Dict[str, dict]) -> Optional[Dict
     Returns:
         Merged event dict with detail page data, or None on failure.
     """
+    global _cache_dirty
     if not identifier:
         return None
 
@@ -260,24 +415,20 @@ def fetch_event_detail(identifier: str, cache: Dict[str, dict]) -> Optional[Dict
     url = f"{config.BASE_URL}/events/{identifier}"
 
     try:
-        time.sleep(config.FETCH_DELAY_SEC)
+        _FETCH_LIMITER.wait()
         response = fetch_with_retries(url)
-        
+
         # Extract detail based on extraction method
         if config.EXTRACTION_METHOD == "api":
-            detail = extract_event_detail_from_api(identifier, {
-                "api_detail_endpoint": f"{config.BASE_URL}/api/events/{{id}}",
-                "api_headers": config.API_HEADERS,
-            })
+            detail = extract_event_detail_from_api(identifier, _API_DETAIL_CONFIG)
         else:
-            detail = extract_event_from_detail_page(response.text, {
-                "json_script_id": config.JSON_SCRIPT_ID,
-                "json_detail_path": config.JSON_PATH + ["event"],
-                "base_url": config.BASE_URL,
-            })
+            detail = extract_event_from_detail_page(response.text, _DETAIL_CONFIG)
 
         if detail:
-            cache[identifier] = {**detail, "cached_at": datetime.datetime.now().isoformat()}
+            entry = {**detail, "cached_at": time.time()}
+            with _cache_lock:
+                cache[identifier] = entry
+                _cache_dirty = True
             logger.info("Fetched detail for: %s", identifier)
             return detail
     except requests.RequestException as e:
@@ -285,6 +436,36 @@ def fetch_event_detail(identifier: str, cache: Dict[str, dict]) -> Optional[Dict
     return None
 
 
+def fetch_event_details_bulk(
+    identifiers: Iterable[Optional[str]], cache: Dict[str, dict]
+) -> Dict[str, Optional[Dict[str, Any]]]:
+    """Fetch details for many events, running uncached fetches concurrently.
+
+    Cached identifiers are resolved inline; the rest are spread over
+    FETCH_WORKERS threads that share the FETCH_DELAY_SEC rate limit.
+
+    Args:
+        identifiers: Event identifiers (falsy entries are ignored)
+        cache: Cache dict to read/write
+
+    Returns:
+        Dict mapping each identifier to its detail dict, or None on failure.
+    """
+    details: Dict[str, Optional[Dict[str, Any]]] = {}
+    pending = []
+    for identifier in dict.fromkeys(i for i in identifiers if i):
+        if identifier in cache:
+            details[identifier] = fetch_event_detail(identifier, cache)
+        else:
+            pending.append(identifier)
+
+    if pending:
+        with ThreadPoolExecutor(max_workers=max(1, config.FETCH_WORKERS)) as executor:
+            fetched = executor.map(lambda identifier: fetch_event_detail(identifier, cache), pending)
+            details.update(zip(pending, fetched))
+    return details
+
+
 def merge_event_detail(
     list_event: Dict[str, Any], detail_event: Optional[Dict[str, Any]]
 ) -> Dict[str, Any]:
@@ -315,16 +496,37 @@ def merge_event_detail(
     for key, value in detail_event.items():
         if value is not None and key not in ["cached_at"]:
             merged[key] = value
+
+    # Times from the detail page invalidate the ones parsed in main()
+    if detail_event.get("start_at") is not None:
+        merged.pop("_start_dt", None)
+    if detail_event.get("updated_at") is not None:
+        merged.pop("_updated_dt", None)
     
     return merged
 
 
+def _event_start(event: Dict[str, Any]) -> Optional[datetime.datetime]:
+    """Return the event's parsed start_at, reusing the one main() stored."""
+    if "_start_dt" in event:
+        return event["_start_dt"]
+    return parse_iso_datetime(event.get("start_at"))
+
+
 # ============================================================================
 # ICALENDAR GENERATION
 # ============================================================================
 
-def generate_alarm(alarm_config: Dict[str, Any], event_start: datetime.datetime) -> str:
+def generate_alarm(alarm_config: Dict[str, Any], event_start: Optional[datetime.datetime]) -> str:
     """Generate a VALARM component for iCalendar using RFC 5545 duration format."""
+    return ICAL_NEWLINE.join(generate_alarm_lines(alarm_config, event_start)) + ICAL_NEWLINE
+
+
+def generate_alarm_lines(alarm_config: Dict[str, Any], event_start: Optional[datetime.datetime]) -> List[str]:
+    """Return the lines of a VALARM component, ready to extend a VEVENT with.
+
+    event_start is only used for same-day alarms (days_before == 0).
+    """
     days = alarm_config.get("days_before", 1)
     time_str = alarm_config.get("time", config.NOTIFICATION_TIME)
     time_parts = time_str.split(":")
@@ -351,30 +553,54 @@ def generate_alarm(alarm_config: Dict[str, Any], event_start: datetime.datetime)
         trigger_line = f"TRIGGER:-P{days}D"
 
     description = alarm_config.get("description", "Event Reminder")
-    alarm_lines = [
+    folded = escape_and_fold_ical_text(description, "DESCRIPTION:", config.ICAL_LINE_LENGTH)
+    return [
         "BEGIN:VALARM",
         "ACTION:DISPLAY",
-        escape_and_fold_ical_text(description, "DESCRIPTION:", config.ICAL_LINE_LENGTH),
+        *(line for line in folded.split("\n") if line.strip()),
         trigger_line,
         "END:VALARM",
-        "",
     ]
-    return ICAL_NEWLINE.join(alarm_lines)
 
 
-def make_ics_event(event: Dict[str, Any]) -> str:
+def build_alarm_plan() -> List[Tuple[Optional[List[str]], Dict[str, Any]]]:
+    """Pair each configured alarm with its VALARM lines, if they are event-independent.
+
+    Only same-day alarms (days_before == 0) depend on the event's start time;
+    those get None and are generated per event, in their configured order.
+    Build it once per calendar and pass it to make_ics_event().
+    """
+    if not config.NOTIFICATIONS.get("enabled", False):
+        return []
+    plan = []
+    for alarm in config.NOTIFICATIONS.get("alarms", []):
+        static_lines = None
+        if alarm.get("days_before", 1) != 0:
+            static_lines = generate_alarm_lines(alarm, None)
+        plan.append((static_lines, alarm))
+    return plan
+
+
+def make_ics_event(
+    event: Dict[str, Any],
+    default_dtstamp: Optional[str] = None,
+    alarm_plan: Optional[List[Tuple[Optional[List[str]], Dict[str, Any]]]] = None,
+) -> str:
     """Return an iCalendar VEVENT string for an event.
 
     CUSTOMIZE THIS to handle fields specific to your events.
 
     Args:
         event: Event dictionary
+        default_dtstamp: DTSTAMP for events without a valid updated_at
+            (defaults to the current time)
+        alarm_plan: Result of build_alarm_plan() (built from config if omitted)
 
     Returns:
         iCalendar VEVENT string
     """
+    line_length = config.ICAL_LINE_LENGTH
     title = event.get("title", "Untitled Event")
-    start_at = event.get("start_at")
     end_at = event.get("end_at")
     location = event.get("location", "")
     description_raw = event.get("description", "")
@@ -390,7 +616,7 @@ def make_ics_event(event: Dict[str, Any]) -> str:
     else:
         event_url = ""
 
-    start_dt = parse_iso_datetime(start_at)
+    start_dt = _event_start(event)
     end_dt = parse_iso_datetime(end_at)
 
     if not start_dt:
@@ -421,24 +647,28 @@ def make_ics_event(event: Dict[str, Any]) -> str:
     description_text = "\n".join(desc_parts)
 
     # UID (required): stable unique identifier
-    uid = f"{event_id or slug}@{config.UID_DOMAIN}" if (event_id or slug) else None
-    if not uid:
-        uid = f"{start_str}-{slug or title[:20]}@{config.UID_DOMAIN}"
+    uid_key = event_id or slug
+    if uid_key:
+        uid = f"{uid_key}@{config.UID_DOMAIN}"
+    else:
+        uid = f"{start_str}-{title[:20]}@{config.UID_DOMAIN}"
 
     # DTSTAMP (required): when the event was created/updated
-    dtstamp_str = format_ical_datetime(datetime.datetime.now(datetime.timezone.utc))
-    updated_at = event.get("updated_at")
-    if updated_at:
-        upd_dt = parse_iso_datetime(updated_at)
-        if upd_dt:
-            dtstamp_str = format_ical_datetime(upd_dt)
+    if "_updated_dt" in event:
+        upd_dt = event["_updated_dt"]
+    else:
+        upd_dt = parse_iso_datetime(event.get("updated_at"))
+    if upd_dt:
+        dtstamp_str = format_ical_datetime(upd_dt)
+    else:
+        dtstamp_str = default_dtstamp or format_ical_datetime(datetime.datetime.now(datetime.timezone.utc))
 
     # Build VEVENT
-    summary_line = escape_and_fold_ical_text(title, "SUMMARY:", config.ICAL_LINE_LENGTH)
+    summary_line = escape_and_fold_ical_text(title, "SUMMARY:", line_length)
     description_line = escape_and_fold_ical_text(
         description_text,
         "DESCRIPTION:",
-        config.ICAL_LINE_LENGTH,
+        line_length,
     )
     lines = [
         "BEGIN:VEVENT",
@@ -453,13 +683,13 @@ def make_ics_event(event: Dict[str, Any]) -> str:
     # LOCATION
     if location:
         lines.append(
-            escape_and_fold_ical_text(location, "LOCATION:", config.ICAL_LINE_LENGTH)
+            escape_and_fold_ical_text(location, "LOCATION:", line_length)
         )
 
     # URL
     if event_url:
         lines.append(
-            escape_and_fold_ical_text(event_url, "URL:", config.ICAL_LINE_LENGTH)
+            escape_and_fold_ical_text(event_url, "URL:", line_length)
         )
 
     # GEO (if coordinates available)
@@ -473,7 +703,7 @@ def make_ics_event(event: Dict[str, Any]) -> str:
     # X-ALT-DESC: HTML version of description for rich calendar clients (#42)
     html_desc = event.get("html_description") or event.get("description_html", "")
     if html_desc:
-        folded = escape_and_fold_ical_text(html_desc, "X-ALT-DESC;FMTTYPE=text/html:", config.ICAL_LINE_LENGTH)
+        folded = escape_and_fold_ical_text(html_desc, "X-ALT-DESC;FMTTYPE=text/html:", line_length)
         lines.append(folded)
 
     # STATUS
@@ -484,11 +714,10 @@ def make_ics_event(event: Dict[str, Any]) -> str:
     lines.append(f"SEQUENCE:{sequence}")
 
     # VALARMs (nested components)
-    if config.NOTIFICATIONS.get("enabled", False):
-        for alarm in config.NOTIFICATIONS.get("alarms", []):
-            lines.extend(
-                line for line in generate_alarm(alarm, start_dt).splitlines() if line.strip()
-            )
+    if alarm_plan is None:
+        alarm_plan = build_alarm_plan()
+    for static_lines, alarm in alarm_plan:
+        lines.extend(static_lines if static_lines is not None else generate_alarm_lines(alarm, start_dt))
 
     lines.append("END:VEVENT")
     return ICAL_NEWLINE.join(lines) + ICAL_NEWLINE
@@ -548,11 +777,8 @@ def write_metrics_file(event_count: int, upcoming_count: int, status: str, durat
 
 def check_missed_runs() -> int:
     """Check state file for consecutive missed runs. Returns days since last success."""
-    state_path = Path(config.STATE_FILE)
-    if not state_path.exists():
-        return 0
     try:
-        data = json.loads(state_path.read_text())
+        data = read_json(config.STATE_FILE)
         last = data.get("updated", "")
         if last:
             last_dt = datetime.datetime.fromisoformat(last)
@@ -678,32 +904,29 @@ def main() -> None:
         )
         sys.exit(1)
 
-    # Split into future and past
+    # Split into future and past in one pass, parsing each start/update once
     today = datetime.datetime.now(datetime.timezone.utc)
     future_events = []
     past_events = []
+    current_upcoming_slugs = set()
     for e in events:
-        start = parse_iso_datetime(e.get("start_at"))
-        if start:
-            if start.tzinfo is None:
-                start = start.replace(tzinfo=datetime.timezone.utc)
-            if start >= today:
-                future_events.append(e)
-            else:
-                past_events.append(e)
+        start = e["_start_dt"] = parse_iso_datetime(e.get("start_at"))
+        e["_updated_dt"] = parse_iso_datetime(e.get("updated_at"))
+        if start and (start if start.tzinfo else start.replace(tzinfo=datetime.timezone.utc)) < today:
+            past_events.append(e)
         else:
             future_events.append(e)  # No start = treat as future
+            current_upcoming_slugs.add(_slug_key(e))
 
     # Skip full scrape if no NEW upcoming events
     if config.SKIP_IF_NO_NEW_EVENTS:
-        current_upcoming_slugs = {e.get("slug") or e.get("id") or e.get("title") for e in future_events}
         previous_slugs = load_last_upcoming_slugs()
         events_unchanged = not has_new_events(current_upcoming_slugs, previous_slugs) and not (previous_slugs - current_upcoming_slugs)
         if events_unchanged:
             logger.info("No event changes (current=%d, previous=%d), skipping full scrape",
                        len(current_upcoming_slugs), len(previous_slugs))
             print("No new events. Skipping update.")
-            save_last_upcoming_slugs(list(current_upcoming_slugs))
+            save_last_upcoming_slugs(current_upcoming_slugs)
             save_health_status(
                 "success",
                 len(current_upcoming_slugs),
@@ -713,59 +936,54 @@ def main() -> None:
 
     # All events to output
     all_events = (past_events if config.INCLUDE_PAST_EVENTS else []) + future_events
-    all_events.sort(key=lambda x: parse_iso_datetime(x.get("start_at", "")) or datetime.datetime.min.replace(tzinfo=datetime.timezone.utc))
+    all_events.sort(key=lambda x: x["_start_dt"] or _MIN_DT)
 
     # Fetch detail pages and merge
     cache = load_cache()
-    enriched_events = []
-    for event in all_events:
-        identifier = event.get("slug") or event.get("id")
-        detail = fetch_event_detail(identifier, cache) if identifier else None
-        enriched_events.append(merge_event_detail(event, detail))
+    details = fetch_event_details_bulk((e.get("slug") or e.get("id") for e in all_events), cache)
+    enriched_events = [
+        merge_event_detail(event, details.get(event.get("slug") or event.get("id")))
+        for event in all_events
+    ]
     save_cache(cache)
 
     Path(config.OUTPUT_DIR).mkdir(parents=True, exist_ok=True)
 
-    # Generate iCal
-    event_lines = []
-    for event in enriched_events[:config.MAX_EVENTS if config.MAX_EVENTS > 0 else len(enriched_events)]:
-        ical = make_ics_event(event)
-        if ical:
-            event_lines.append(ical)
-
-    ical_content = (
-        ICAL_NEWLINE.join(
-            [
-                "BEGIN:VCALENDAR",
-                "VERSION:2.0",
-                f"PRODID:{config.CALENDAR_PRODID}",
-                "CALSCALE:GREGORIAN",
-                "METHOD:PUBLISH",
-                escape_and_fold_ical_text(config.CALENDAR_NAME, "X-WR-CALNAME:", config.ICAL_LINE_LENGTH),
-                escape_and_fold_ical_text(config.CALENDAR_DESCRIPTION, "X-WR-CALDESC:", config.ICAL_LINE_LENGTH),
-                f"X-WR-TIMEZONE:{config.DEFAULT_TIMEZONE}",
-                "REFRESH-INTERVAL;VALUE=DURATION:PT12H",
-                "X-PUBLISHED-TTL:PT12H",
-            ]
-        )
-        + ICAL_NEWLINE
-        + "".join(event_lines)
-        + f"END:VCALENDAR{ICAL_NEWLINE}"
+    # Generate iCal, writing each VEVENT as it is built
+    default_dtstamp = format_ical_datetime(datetime.datetime.now(datetime.timezone.utc))
+    alarm_plan = build_alarm_plan()
+    ical_header = _ICAL_HEADER % (
+        config.CALENDAR_PRODID,
+        escape_and_fold_ical_text(config.CALENDAR_NAME, "X-WR-CALNAME:", config.ICAL_LINE_LENGTH),
+        escape_and_fold_ical_text(config.CALENDAR_DESCRIPTION, "X-WR-CALDESC:", config.ICAL_LINE_LENGTH),
+        config.DEFAULT_TIMEZONE,
     )
+    event_count = 0
+
+    def ical_chunks() -> Iterable[str]:
+        nonlocal event_count
+        yield ical_header
+        for event in islice(enriched_events, config.MAX_EVENTS if config.MAX_EVENTS > 0 else None):
+            ical = make_ics_event(event, default_dtstamp, alarm_plan)
+            if ical:
+                event_count += 1
+                yield ical
+        yield f"END:VCALENDAR{ICAL_NEWLINE}"
 
     ics_path = Path(output_dir) / f"{config.ICS_FILENAME}.ics"
     if dry_run:
-        logger.info("DRY-RUN: Would write %s (%d events)", ics_path, len(event_lines))
+        for _ in ical_chunks():
+            pass
+        logger.info("DRY-RUN: Would write %s (%d events)", ics_path, event_count)
     else:
-        atomic_write(ics_path, ical_content)
-        logger.info("Wrote %s (%d events)", ics_path, len(event_lines))
+        atomic_write_chunks(ics_path, ical_chunks())
+        logger.info("Wrote %s (%d events)", ics_path, event_count)
 
     # Save state
-    current_upcoming_slugs = {e.get("slug") or e.get("id") or e.get("title") for e in future_events}
     if not dry_run:
-        save_last_upcoming_slugs(list(current_upcoming_slugs))
-        save_health_status("success", len(event_lines),
-            f"Successfully processed {len(event_lines)} events ({len(current_upcoming_slugs)} upcoming)")
+        save_last_upcoming_slugs(current_upcoming_slugs)
+        save_health_status("success", event_count,
+            f"Successfully processed {event_count} events ({len(current_upcoming_slugs)} upcoming)")
 
     # Generate HTML pages
     try:
@@ -797,8 +1015,8 @@ def main() -> None:
 
             if config.INCLUDE_PAST_EVENTS:
                 past_enriched = [e for e in enriched_events
-                               if parse_iso_datetime(e.get("start_at")) and
-                               parse_iso_datetime(e.get("start_at")).replace(tzinfo=datetime.timezone.utc) < today]
+                               if (start := _event_start(e)) and
+                               start.replace(tzinfo=datetime.timezone.utc) < today]
                 archive_path = Path(output_dir) / "archive.html"
                 atomic_write(archive_path, build_archive_html(past_enriched))
                 logger.info("Wrote %s with %d past events", archive_path, len(past_enriched))
@@ -809,7 +1027,7 @@ def main() -> None:
 
     # Prometheus metrics (#37)
     elapsed = time.time() - start_time
-    write_metrics_file(len(event_lines), len(current_upcoming_slugs), "success", elapsed)
+    write_metrics_file(event_count, len(current_upcoming_slugs), "success", elapsed)
 
     # Health check endpoint (#23) — plain-text for monitoring tools
     health_path = Path(output_dir) / "health"
@@ -821,7 +1039,7 @@ def main() -> None:
     if config.PUSHOVER_ENABLED and not dry_run:
         send_pushover_notification(
             f"Scraper: {config.CALENDAR_NAME}",
-            f"{len(event_lines)} events processed ({len(current_upcoming_slugs)} upcoming)\n"
+            f"{event_count} events processed ({len(current_upcoming_slugs)} upcoming)\n"
             f"Duration: {elapsed:.1f}s"
         )
 
@@ -831,10 +1049,10 @@ def main() -> None:
     updated_count = len(previous_set - current_upcoming_slugs) if previous_set else 0
     unchanged = len(current_upcoming_slugs) - new_count
     if not args.quiet:
-        print(f"\n{'[DRY RUN] ' if dry_run else ''}✓ {len(event_lines)} events "
+        print(f"\n{'[DRY RUN] ' if dry_run else ''}✓ {event_count} events "
               f"({new_count} new, {updated_count} removed, {unchanged} unchanged) in {elapsed:.1f}s\n")
         for event in enriched_events[:10]:
-            start = parse_iso_datetime(event.get("start_at"))
+            start = _event_start(event)
             date_str = start.strftime("%d %B %Y %H:%M") if start else "?"
             print(f"  • {event.get('title')} – {date_str} @ {event.get('location', 'TBC')}")
 
@@ -2,8 +2,10 @@
 
 Customize these tests based on your specific scraper implementation.
 """
+import json
 import unittest
 from pathlib import Path
+from unittest import mock
 
 # Import your scraper functions
 # from scraper import validate_event_data, parse_iso_datetime
@@ -47,6 +49,34 @@ class TestDateParsing(unittest.TestCase):
         pass
 
 
+class TestStripHtml(unittest.TestCase):
+    """Test HTML cleaning utilities."""
+
+    MALFORMED = (
+        "<[>](z) tail",
+        "<[a](>) tail",
+        "[<](u)b> tail",
+        "[&](c)lt; tail",
+        "[a [b](c) d",
+        "[unclosed link text",
+        "[a](unclosed url",
+        "[]() [x]y (z)",
+        "a < b > c <> d >< e",
+        "stray < without close",
+        "&amp &ampx &#; &#x; &nbsp",
+    )
+
+    def test_truncated_matches_strip_html_on_malformed_markup(self):
+        """strip_html_truncated() equals strip_html()[:limit], also when it stops early."""
+        from utils import strip_html, strip_html_truncated
+
+        filler = "<p>word &amp; [link](http://x) more</p> " * 40
+        for fragment in self.MALFORMED:
+            for html in (fragment, fragment + " " + filler, filler + fragment + " " + filler):
+                for limit in (1, 7, 40, 200):
+                    self.assertEqual(strip_html_truncated(html, limit), strip_html(html)[:limit], (html[:60], limit))
+
+
 class TestExtraction(unittest.TestCase):
     """Test extraction logic."""
 
@@ -59,6 +89,50 @@ class TestExtraction(unittest.TestCase):
         # self.assertGreater(len(events), 0)
         pass
 
+    def _json_page(self, data):
+        """Wrap ``data`` in a __NEXT_DATA__ script tag."""
+        payload = json.dumps(data)
+        return f'<html><script id="__NEXT_DATA__" type="application/json">{payload}</script></html>'
+
+    def _extract_both_ways(self, html, config):
+        """Run the JSON extractor with the installed parser and with plain json (ijson route)."""
+        from extractors import json_extractor
+
+        with_default = json_extractor.extract_events_from_page(html, config)
+        with mock.patch.object(json_extractor, "_loads", json.loads):
+            with_json = json_extractor.extract_events_from_page(html, config)
+        return with_default, with_json
+
+    def test_json_extraction_dotted_key(self):
+        """Keys containing "." are looked up literally, not as nested keys."""
+        html = self._json_page({
+            "a": {"b": {"c": [{"slug": "wrong", "title": "Wrong"}]}},
+            "a.b": {"c": [{"slug": "right", "title": "Right"}]},
+        })
+        for events in self._extract_both_ways(html, {"json_path": ["a.b", "c"]}):
+            self.assertEqual([e["slug"] for e in events], ["right"])
+
+    def test_json_extraction_big_int(self):
+        """Integers wider than 64 bits anywhere in the payload don't break extraction."""
+        html = self._json_page({
+            "build": 123456789012345678901234567890,
+            "props": {"pageProps": {"events": [{"slug": "a", "id": 2 ** 70, "title": "A"}]}},
+        })
+        for events in self._extract_both_ways(html, {}):
+            self.assertEqual([e["id"] for e in events], [2 ** 70])
+
+    def test_json_extraction_non_dict_on_path(self):
+        """A non-dict partway along json_path is reported as such."""
+        html = self._json_page({"props": [1, 2]})
+        for events in self._extract_both_ways(html, {}):
+            self.assertEqual(events, [])
+        from extractors import json_extractor
+
+        with mock.patch.object(json_extractor, "_loads", json.loads), \
+                self.assertLogs(json_extractor.logger, "ERROR") as logs:
+            json_extractor.extract_events_from_page(html, {})
+        self.assertIn("Expected dict at path ['props']", logs.output[0])
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -8,12 +8,31 @@ import json
 import os
 import re
 import tempfile
+import threading
+import time
+from functools import lru_cache
+from html import unescape as _unescape
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Dict, FrozenSet, Iterable, Optional, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    from ciso8601 import parse_datetime as _parse_datetime
+except ImportError:
+    # Python 3.11+ fromisoformat accepts "Z" and fractional seconds itself
+    _parse_datetime = datetime.datetime.fromisoformat
+
+
+_MD_LINK_RE = re.compile(r"\[([^\]]+)\]\([^)]+\)")
+_TAG_RE = re.compile(r"<[^>]+>")
 
 
 def strip_html(html: str) -> str:
-    """Remove HTML tags and decode common entities.
+    """Remove HTML tags and decode HTML entities.
 
     Args:
         html: HTML string to clean
@@ -24,21 +43,75 @@ def strip_html(html: str) -> str:
     if not html:
         return ""
     # Remove markdown-style links [text](url) -> text
-    text = re.sub(r"\[([^\]]+)\]\([^)]+\)", r"\1", html)
+    text = _MD_LINK_RE.sub(r"\1", html)
     # Remove HTML tags
-    text = re.sub(r"<[^>]+>", " ", text)
-    # Decode common entities
-    text = text.replace("&nbsp;", " ").replace("&amp;", "&")
-    text = text.replace("&lt;", "<").replace("&gt;", ">").replace("&quot;", '"')
-    text = text.replace("&#39;", "'").replace("&apos;", "'")
-    # Normalise whitespace
-    text = re.sub(r"\s+", " ", text).strip()
-    return text
+    text = _TAG_RE.sub(" ", text)
+    # Decode entities
+    text = _unescape(text)
+    # Normalise whitespace (str.split() uses the same whitespace set as \s)
+    return " ".join(text.split())
 
 
+def _md_links_closed(text: str) -> bool:
+    """Return True if no ``[text](url)`` link starting in ``text`` is left open at its end.
+
+    Walks the "[" positions the way _MD_LINK_RE.sub() does, so a link cut off
+    by the end of ``text`` is told apart from a "[" that can never match.
+    """
+    end = len(text)
+    start = text.find("[")
+    while start != -1:
+        close = text.find("]", start + 1)
+        if close == -1 or close + 1 == end:
+            return False
+        if close > start + 1 and text[close + 1] == "(":
+            if close + 2 == end:
+                return False
+            if text[close + 2] != ")":
+                paren = text.find(")", close + 2)
+                if paren == -1:
+                    return False
+                start = text.find("[", paren + 1)
+                continue
+        # No link can start before ``close``: they would all stop at it
+        start = text.find("[", close + 1)
+    return True
+
+
+def strip_html_truncated(html: str, limit: int) -> str:
+    """Return ``strip_html(html)[:limit]`` without cleaning all of a long description.
+
+    strip_html() runs on the shortest prefix ending at a space that leaves no
+    markdown link or tag open and still yields ``limit`` chars. No link, tag
+    or entity can span that space, so the rest of the text cannot change the
+    result.
+    """
+    if not html or limit <= 0:
+        return ""
+    size = 4 * limit
+    while 2 * size < len(html):
+        cut = html.find(" ", size)
+        if cut == -1:
+            break
+        head = html[:cut]
+        if _md_links_closed(head):
+            text = _MD_LINK_RE.sub(r"\1", head)
+            if text.rfind("<") <= text.rfind(">"):
+                text = " ".join(_unescape(_TAG_RE.sub(" ", text)).split())
+                if len(text) >= limit:
+                    return text[:limit]
+        size = 2 * cut
+    return strip_html(html)[:limit]
+
+
+@lru_cache(maxsize=8192)
 def parse_iso_datetime(iso_str: str) -> Optional[datetime.datetime]:
     """Parse ISO 8601 datetime string to datetime (timezone-aware or naive).
 
+    Results are memoized: the same start_at strings are parsed again for
+    sorting, partitioning and every page template. Uses ciso8601 when
+    installed.
+
     Handles formats like:
     - 2026-03-16T11:30:00.000-06:00
     - 2026-03-28T10:30:00.000Z
@@ -53,15 +126,37 @@ def parse_iso_datetime(iso_str: str) -> Optional[datetime.datetime]:
     if not iso_str:
         return None
     try:
-        # Handle Z suffix and milliseconds
-        dt = datetime.datetime.fromisoformat(
-            iso_str.replace("Z", "+00:00").replace(".000", "")
-        )
-        return dt
+        return _parse_datetime(iso_str)
     except (ValueError, TypeError):
         return None
 
 
+# English month names and abbreviations -> month number
+_MONTHS = {}
+for _i, _name in enumerate(
+    ("january", "february", "march", "april", "may", "june", "july",
+     "august", "september", "october", "november", "december"),
+    start=1,
+):
+    _MONTHS[_name] = _MONTHS[_name[:3]] = _i
+del _i, _name
+
+# Fallback formats tried by parse_date_from_text(): pattern and the group
+# order of (day, month, year)
+_DATE_PATTERNS = (
+    (re.compile(r"(\d{1,2})\s+([A-Za-z]+)\s+(\d{4})"), (0, 1, 2)),  # 10 October 2025, 10 Oct 2025
+    (re.compile(r"(\d{1,2})/(\d{1,2})/(\d{4})"), (0, 1, 2)),  # 10/10/2025
+    (re.compile(r"(\d{4})-(\d{1,2})-(\d{1,2})"), (2, 1, 0)),  # 2025-10-10
+    (re.compile(r"([A-Za-z]+)\s+(\d{1,2}),\s+(\d{4})"), (1, 0, 2)),  # October 10, 2025
+)
+
+
+@lru_cache(maxsize=32)
+def compile_pattern(pattern: str, flags: int = 0) -> "re.Pattern[str]":
+    """Compile a config-supplied regex once and reuse it across calls."""
+    return re.compile(pattern, flags)
+
+
 def parse_date_from_text(text: str, pattern: Optional[str] = None) -> Optional[datetime.date]:
     """Parse date from text using regex pattern.
 
@@ -81,7 +176,7 @@ def parse_date_from_text(text: str, pattern: Optional[str] = None) -> Optional[d
         return None
 
     if pattern:
-        match = re.search(pattern, text)
+        match = compile_pattern(pattern).search(text)
         if match:
             # Custom pattern handling - adjust based on your pattern
             # This is a simple example
@@ -89,29 +184,35 @@ def parse_date_from_text(text: str, pattern: Optional[str] = None) -> Optional[d
                 day = int(match.group(1))
                 month_str = match.group(2)
                 year = int(match.group(3)) if len(match.groups()) > 2 else datetime.date.today().year
-                month = datetime.datetime.strptime(month_str, "%B").month
+                month = _MONTHS.get((month_str or "").lower())
+                if month is None:
+                    return None
                 return datetime.date(year, month, day)
             except (ValueError, IndexError):
                 return None
 
     # Try common formats
-    formats = [
-        "%d %B %Y",  # 10 October 2025
-        "%d/%m/%Y",  # 10/10/2025
-        "%Y-%m-%d",  # 2025-10-10
-        "%d %b %Y",  # 10 Oct 2025
-        "%B %d, %Y",  # October 10, 2025
-    ]
-
-    for fmt in formats:
-        try:
-            return datetime.datetime.strptime(text.strip(), fmt).date()
-        except ValueError:
-            continue
+    text = text.strip()
+    for date_re, (day_i, month_i, year_i) in _DATE_PATTERNS:
+        match = date_re.fullmatch(text)
+        if match:
+            parts = match.groups()
+            month = parts[month_i]
+            month = int(month) if month.isdigit() else _MONTHS.get(month.lower())
+            if month is None:
+                continue
+            try:
+                return datetime.date(int(parts[year_i]), month, int(parts[day_i]))
+            except ValueError:
+                continue
 
     return None
 
 
+# "14:30", "14:30:00" or "2:30 PM"
+_TIME_RE = re.compile(r"(\d{1,2}):(\d{2})(?::(\d{2}))?(?:\s*(AM|PM))?", re.IGNORECASE)
+
+
 def parse_time_from_text(text: str) -> Optional[datetime.time]:
     """Parse time from text.
 
@@ -129,33 +230,21 @@ def parse_time_from_text(text: str) -> Optional[datetime.time]:
     if not text:
         return None
 
-    # Try 24-hour format first
-    time_patterns = [
-        r"(\d{1,2}):(\d{2})(?::(\d{2}))?",  # 14:30 or 14:30:00
-        r"(\d{1,2}):(\d{2})\s*(AM|PM)",  # 2:30 PM
-    ]
-
-    for pattern in time_patterns:
-        match = re.search(pattern, text, re.IGNORECASE)
-        if match:
-            try:
-                hour = int(match.group(1))
-                minute = int(match.group(2))
-                second = int(match.group(3)) if len(match.groups()) > 2 and match.group(3) else 0
-
-                # Handle AM/PM
-                if len(match.groups()) > 2 and match.group(len(match.groups())):
-                    am_pm = match.group(len(match.groups())).upper()
-                    if am_pm == "PM" and hour != 12:
-                        hour += 12
-                    elif am_pm == "AM" and hour == 12:
-                        hour = 0
-
-                return datetime.time(hour, minute, second)
-            except (ValueError, IndexError):
-                continue
-
-    return None
+    match = _TIME_RE.search(text)
+    if not match:
+        return None
+    hour, minute, second, am_pm = match.groups()
+    hour = int(hour)
+    if am_pm:
+        am_pm = am_pm.upper()
+        if am_pm == "PM" and hour < 12:
+            hour += 12
+        elif am_pm == "AM" and hour == 12:
+            hour = 0
+    try:
+        return datetime.time(hour, int(minute), int(second or 0))
+    except ValueError:
+        return None
 
 
 def normalize_url(url: str, base_url: str = "") -> str:
@@ -200,6 +289,9 @@ def sanitize_ical_text(text: str) -> str:
     """
     if not text:
         return ""
+    # Most titles, locations and URLs need no escaping; skip the replaces
+    if not ("\\" in text or "\n" in text or "," in text or ";" in text):
+        return text
 
     # Escape special characters
     text = text.replace("\\", "\\\\")
@@ -227,17 +319,20 @@ def escape_and_fold_ical_text(text: str, prefix: str = "", line_length: int = 75
     if len(full_line) <= line_length:
         return full_line
 
-    result = [full_line[:line_length]]
-    remaining = full_line[line_length:]
-    while remaining:
-        result.append(" " + remaining[: line_length - 1])
-        remaining = remaining[line_length - 1 :]
-    return "\n".join(result)
+    # Continuation lines start with a space, so they carry one char less
+    step = line_length - 1
+    return full_line[:line_length] + "".join(
+        "\n " + full_line[i : i + step] for i in range(line_length, len(full_line), step)
+    )
 
 
+@lru_cache(maxsize=1024)
 def format_ical_datetime(dt: datetime.datetime) -> str:
     """Format datetime for iCal (UTC with Z suffix).
 
+    Memoized: feeds often share updated_at values, and aware datetimes for
+    the same instant compare (and hash) equal, so they share one entry.
+
     Args:
         dt: Datetime to format
 
@@ -277,16 +372,31 @@ def truncate_text(text: str, max_length: int, suffix: str = "...") -> str:
     return text[: max_length - len(suffix)] + suffix
 
 
-def atomic_write(path: Path, content: str) -> None:
+def has_required_fields(event: Dict[str, Any], required: FrozenSet[str]) -> bool:
+    """Check that an event has a non-empty value for every required field.
+
+    Args:
+        event: Event dict to check
+        required: Field names that must be present and truthy
+
+    Returns:
+        True if all required fields are set
+    """
+    return required.issubset(event) and all(event[field] for field in required)
+
+
+def atomic_write(path: Path, content: Union[str, bytes]) -> None:
     """Write content to file atomically to prevent corruption on crash.
 
     Writes to a temp file in the same directory, then renames.
     If the process crashes mid-write, the original file is untouched.
+    Text is encoded as UTF-8; bytes are written as-is.
     """
+    data = content.encode("utf-8") if isinstance(content, str) else content
     path.parent.mkdir(parents=True, exist_ok=True)
     fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=path.name + ".", suffix=".tmp")
     try:
-        os.write(fd, content.encode("utf-8"))
+        os.write(fd, data)
         os.fsync(fd)
         os.close(fd)
         os.replace(tmp, path)
@@ -297,12 +407,55 @@ def atomic_write(path: Path, content: str) -> None:
         raise
 
 
-def atomic_write_json(path: Path, data: Any) -> None:
-    """Atomically write JSON data to file."""
-    content = json.dumps(data, indent=2, ensure_ascii=False)
+def atomic_write_chunks(path: Path, chunks: Iterable[str]) -> None:
+    """Atomically write text chunks to file as they are produced.
+
+    Same temp-file-and-rename scheme as atomic_write(), but the content is
+    never held in memory as a whole. Newlines are written untranslated.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=path.name + ".", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8", newline="", buffering=1 << 16) as f:
+            for chunk in chunks:
+                f.write(chunk)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
+    except Exception:
+        if os.path.exists(tmp):
+            os.unlink(tmp)
+        raise
+
+
+def atomic_write_json(path: Path, data: Any, indent: bool = True) -> None:
+    """Atomically write JSON data to file (serialized with orjson when installed).
+
+    With ``indent=False`` the JSON is written on a single line with no spaces.
+    """
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        option |= orjson.OPT_INDENT_2 if indent else orjson.OPT_APPEND_NEWLINE
+        content = orjson.dumps(data, option=option)
+    elif indent:
+        content = json.dumps(data, indent=2, ensure_ascii=False)
+    else:
+        content = json.dumps(data, separators=(",", ":"), ensure_ascii=False) + "\n"
     atomic_write(path, content)
 
 
+def read_json(path: Union[str, Path]) -> Any:
+    """Read and parse a JSON file (with orjson when installed).
+
+    Raises:
+        OSError: If the file cannot be read
+        json.JSONDecodeError: If the content is not valid JSON
+    """
+    with open(path, "rb") as f:
+        content = f.read()
+    return orjson.loads(content) if orjson is not None else json.loads(content)
+
+
 def extract_text_between(text: str, start: str, end: str) -> Optional[str]:
     """Extract text between two markers.
 
@@ -322,3 +475,27 @@ def extract_text_between(text: str, start: str, end: str) -> Optional[str]:
     if end_idx == -1:
         return None
     return text[start_idx:end_idx].strip()
+
+
+class RateLimiter:
+    """Space out calls so that, across all threads, one starts per interval.
+
+    Args:
+        interval: Minimum seconds between consecutive calls (0 disables limiting)
+    """
+
+    def __init__(self, interval: float) -> None:
+        self.interval = interval
+        self._lock = threading.Lock()
+        self._next_slot = 0.0
+
+    def wait(self) -> None:
+        """Block until the caller may start its next call."""
+        if self.interval <= 0:
+            return
+        with self._lock:
+            now = time.monotonic()
+            delay = self._next_slot - now
+            self._next_slot = max(now, self._next_slot) + self.interval
+        if delay > 0:
+            time.sleep(delay)